@@ -25,29 +25,38 @@ def main():
     logger = configure_logging(config.logging)
     # Create runner
     runner = DBRunner(config.database, logger)
-    # Statements to drop, create, and populate test tables
-    statements = [
-        # Drop existing tables if they exist (default database)
+    # Drop existing tables if they exist (default database); a missing table is not an error
+    drops = [
         "DROP TABLE customers;",
         "DROP TABLE sales;",
-        # Create tables in default database
+    ]
+    for sql in drops:
+        try:
+            logger.info(f"Executing: {sql}")
+            runner.run(sql)
+        except Exception as e:
+            logger.warning(f"Ignoring error for statement: {e}")
+    # Create tables in default database (DDL must be sent one statement per request)
+    creates = [
         "CREATE TABLE customers (customer_id INTEGER, status VARCHAR(20));",
         "CREATE TABLE sales (customer_id INTEGER, amount DECIMAL(10,2));",
-        # Insert sample data (Teradata requires single-row INSERTs)
+    ]
+    # Insert sample data, sent together as a single multi-statement request
+    inserts = "\n".join([
         "INSERT INTO customers (customer_id, status) VALUES (1, 'Active');",
         "INSERT INTO customers (customer_id, status) VALUES (2, 'Pending');",
         "INSERT INTO customers (customer_id, status) VALUES (3, 'Inactive');",
         "INSERT INTO sales (customer_id, amount) VALUES (1, 50.00);",
         "INSERT INTO sales (customer_id, amount) VALUES (1, 150.00);",
         "INSERT INTO sales (customer_id, amount) VALUES (2, 75.00);",
-        "INSERT INTO sales (customer_id, amount) VALUES (3, 0.00);"
-    ]
-    for sql in statements:
-        try:
-            logger.info(f"Executing: {sql}")
-            runner.run(sql)
-        except Exception as e:
-            logger.warning(f"Ignoring error for statement: {e}")
+        "INSERT INTO sales (customer_id, amount) VALUES (3, 0.00);",
+    ])
+    try:
+        runner.run_many(creates + [inserts])
+    except Exception as e:
+        logger.error(f"Failed to prepare test tables: {e}")
+        runner.cleanup()
+        sys.exit(1)
     # Cleanup
     runner.cleanup()
     logger.info("Test tables have been prepared.")
@@ -1,37 +1,170 @@
 import os
 import re
-import tkinter as tk
-from tkinter import ttk, messagebox
+import json
+import fnmatch
+import threading
 from pathlib import Path
-from collections import defaultdict
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import pytesseract
-except ImportError:
-    print("Pytesseract not found. Please install it with 'pip install pytesseract'")
-    exit()
+# tkinter, PIL and the OCR bindings are imported where they are used, so that
+# find_screenshot_files can be imported (and the script can bail out early)
+# without paying for them.
 
 # --- CONFIGURATION ---
 TESSERACT_CMD_PATH = r'' # Example for Windows: r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 ROOT_FOLDER = r'/home/taco/projects/recodeWaterfall/images' # Example: r'C:\Users\YourUser\Desktop\MyImages'
 # --- END OF CONFIGURATION ---
 
-if TESSERACT_CMD_PATH:
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD_PATH
+# OCR backend, filled in by load_ocr_backend()
+PyTessBaseAPI = PSM = OEM = pytesseract = None
+
+
+def load_ocr_backend():
+    """
+    Import the OCR backend. Prefer tesserocr, which keeps libtesseract loaded
+    in-process; pytesseract spawns a new tesseract process (and reloads the
+    model) for every image.
+    """
+    global PyTessBaseAPI, PSM, OEM, pytesseract
+    try:
+        from tesserocr import PyTessBaseAPI, PSM, OEM
+    except ImportError:
+        try:
+            import pytesseract
+        except ImportError:
+            print("Neither tesserocr nor pytesseract found. Please install one with 'pip install tesserocr' or 'pip install pytesseract'")
+            exit()
+        if TESSERACT_CMD_PATH:
+            pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD_PATH
 
 # Crop dimensions
 ORIGINAL_WIDTH, ORIGINAL_HEIGHT = 1920, 1080
 MAIN_CROP_BOX = (510, 38, ORIGINAL_WIDTH - 29, ORIGINAL_HEIGHT - 124)
 OCR_CROP_BOX = (550, 959, ORIGINAL_WIDTH - 855, ORIGINAL_HEIGHT - 99)
+DISPLAY_SIZE = (550, 450)
+# OCR results are remembered here (inside ROOT_FOLDER) so re-runs skip Tesseract
+OCR_CACHE_FILENAME = '.ocr_cache.json'
+# zlib level for saved crops: 1 encodes several times faster than PIL's default (6)
+# for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
+# Timestamp embedded in screenshot file names, used as the sort key
+TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2}\s\d{2}-\d{2}-\d{2})')
+# Characters that are not allowed in file names
+INVALID_FILENAME_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+
+
+def make_display_image(img, box=DISPLAY_SIZE):
+    """
+    Downscale img to fit inside box, keeping its aspect ratio.
+    Integer factors are handled by Image.reduce (a cheap box filter); only the
+    small remaining step goes through a general resampler.
+    """
+    from PIL import Image
+
+    width, height = img.size
+    factor = max(1, min(width // box[0], height // box[1]))
+    if factor > 1:
+        img = img.reduce(factor)
+        width, height = img.size
+    scale = min(box[0] / width, box[1] / height, 1.0)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if size == img.size:
+        return img
+    return img.resize(size, Image.BILINEAR)
+
+
+# One Tesseract API per worker thread; PyTessBaseAPI is not thread-safe
+_ocr_state = threading.local()
+
+
+def ocr_single_line(img):
+    """Read a single line of text from img."""
+    if PyTessBaseAPI is None:
+        return pytesseract.image_to_string(img, config='--oem 3 --psm 7').strip()
+    api = getattr(_ocr_state, 'api', None)
+    if api is None:
+        api = _ocr_state.api = PyTessBaseAPI(psm=PSM.SINGLE_LINE, oem=OEM.DEFAULT)
+    api.SetImage(img)
+    return api.GetUTF8Text().strip()
+
+
+def read_ocr_crop(original):
+    """
+    OCR the file-path strip of a decoded screenshot.
+    Tesseract binarises internally, so hand it a single-channel image: a third of
+    the pixel data to copy (or to encode, on the pytesseract path).
+    """
+    return ocr_single_line(original.crop(OCR_CROP_BOX).convert('L'))
+
+
+def ocr_screenshot(image_path):
+    """Open one screenshot and OCR its file-path strip; used by the OCR process pool."""
+    from PIL import Image
+
+    with Image.open(image_path) as original:
+        return read_ocr_crop(original)
+
+
+def load_ocr_cache(root_dir):
+    """Return {path: {'mtime_ns': int, 'text': str}} from a previous run, or {}."""
+    try:
+        with open(os.path.join(root_dir, OCR_CACHE_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_ocr_cache(root_dir, cache):
+    try:
+        with open(os.path.join(root_dir, OCR_CACHE_FILENAME), 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Could not save OCR cache: {e}")
+
+
+def prepare_image(image_path, ocr_result=None):
+    """
+    Open, crop, downscale and OCR one screenshot.
+    Only touches PIL/Tesseract (no Tk), so it can run on a worker thread.
+    If ocr_result is given (the text, or a Future resolving to it), OCR is skipped.
+    """
+    from PIL import Image
+
+    # Decode once up front; both crops below then share the decoded pixels, and
+    # PIL closes the source file as soon as it is fully loaded
+    original = Image.open(image_path)
+    original.load()
+    cropped = original.crop(MAIN_CROP_BOX)
+
+    # Create display-sized versions
+    original_display = make_display_image(original)
+    cropped_display = make_display_image(cropped)
+
+    if isinstance(ocr_result, str):
+        ocr_text = ocr_result
+    elif ocr_result is not None:
+        ocr_text = ocr_result.result()
+    else:
+        ocr_text = read_ocr_crop(original)
+    return cropped, original_display, cropped_display, ocr_text
 
 
 class CropValidatorApp:
-    def __init__(self, root, image_paths):
+    def __init__(self, root, image_paths, ocr_results=None):
+        import tkinter as tk
+        from tkinter import ttk
+
         self.root = root
         self.image_paths = image_paths
+        # Optional {image_path: str or Future[str]} of OCR results known ahead of time
+        self.ocr_results = ocr_results or {}
         self.current_index = 0
-        self.name_counter = defaultdict(int)
+        self.name_counter = {}
+        # Worker that prepares the current image and prefetches the next one
+        # while the user is filling in the form
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.pending = {}
 
         self.root.title("Image Crop Validator")
         self.root.geometry("1200x600")
@@ -87,47 +220,49 @@ class CropValidatorApp:
         self.load_next_image()
 
     def load_next_image(self):
+        from tkinter import messagebox
+        from PIL import ImageTk
+
         if self.current_index >= len(self.image_paths):
+            self.executor.shutdown(wait=False, cancel_futures=True)
             messagebox.showinfo("Done", "All images have been processed!")
             self.root.quit()
             return
 
         image_path = self.image_paths[self.current_index]
+        future = self.pending.pop(self.current_index, None) or self.executor.submit(
+            prepare_image, image_path, self.ocr_results.get(image_path))
         self.current_index += 1
+        # Start preparing the next image before blocking on this one
+        if self.current_index < len(self.image_paths):
+            next_path = self.image_paths[self.current_index]
+            self.pending[self.current_index] = self.executor.submit(
+                prepare_image, next_path, self.ocr_results.get(next_path))
         
         self.progress_label.config(text=f"Processing Image {self.current_index} of {len(self.image_paths)}")
 
         try:
-            # Open images
-            self.original_pil_img = Image.open(image_path)
-            self.cropped_pil_img = self.original_pil_img.crop(MAIN_CROP_BOX)
-            
-            # Create display-sized versions
-            original_display = self.original_pil_img.copy()
-            original_display.thumbnail((550, 450))
+            self.cropped_pil_img, original_display, cropped_display, ocr_text = future.result()
+
+            # Tk images must be created on the main thread
             self.original_tk_img = ImageTk.PhotoImage(original_display)
             self.original_img_label.config(image=self.original_tk_img)
 
-            cropped_display = self.cropped_pil_img.copy()
-            cropped_display.thumbnail((550, 450))
             self.cropped_tk_img = ImageTk.PhotoImage(cropped_display)
             self.cropped_img_label.config(image=self.cropped_tk_img)
             
             # Pre-fill data
             folder_name = image_path.parent.name
-            
-            ocr_crop_img = self.original_pil_img.crop(OCR_CROP_BOX)
-            ocr_text = pytesseract.image_to_string(ocr_crop_img, config='--oem 3 --psm 7').strip()
 
             if '/' in ocr_text:
                 script_name = ocr_text.split('/')[-1]
-                script_name = re.sub(r'[\\/*?:"<>|]', "", script_name)
+                script_name = INVALID_FILENAME_CHARS_RE.sub("", script_name)
             else:
                 script_name = "UNKNOWN_SCRIPT" # Default if OCR fails
             
             # Determine prospective increment
             prospective_key = (folder_name, script_name)
-            increment_num = self.name_counter[prospective_key] + 1
+            increment_num = self.name_counter.get(prospective_key, 0) + 1
 
             self.folder_var.set(folder_name)
             self.script_var.set(script_name)
@@ -138,6 +273,8 @@ class CropValidatorApp:
             self.load_next_image() # Skip to next on error
 
     def confirm_and_save(self):
+        from tkinter import messagebox
+
         folder_name = self.folder_var.get()
         script_name = self.script_var.get()
         increment_num = self.inc_var.get()
@@ -149,14 +286,14 @@ class CropValidatorApp:
         try:
             # Use confirmed values to save file and update counter
             name_key = (folder_name, script_name)
-            self.name_counter[name_key] += 1
+            self.name_counter[name_key] = self.name_counter.get(name_key, 0) + 1
             
             new_filename = f"{folder_name} {script_name} {increment_num}.png"
             image_path = self.image_paths[self.current_index - 1]
             output_path = image_path.parent / new_filename
             
             # Save the full-resolution cropped image
-            self.cropped_pil_img.save(output_path)
+            self.cropped_pil_img.save(output_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
             
         except Exception as e:
             messagebox.showerror("Save Error", f"Could not save the file:\n{e}")
@@ -167,14 +304,30 @@ class CropValidatorApp:
         self.load_next_image()
 
 def find_screenshot_files(root_dir):
-    root_path = Path(root_dir)
-    if not root_path.is_dir():
+    """
+    Recursively find '*Screenshot*.png' files under root_dir, sorted by the
+    timestamp in their names.
+    """
+    if not os.path.isdir(root_dir):
         return []
-    all_files = list(root_path.rglob('*Screenshot*.png'))
-    def get_sort_key(file_path):
-        match = re.search(r'(\d{4}-\d{2}-\d{2}\s\d{2}-\d{2}-\d{2})', str(file_path.name))
-        return match.group(1) if match else ""
-    return sorted(all_files, key=get_sort_key)
+    keyed_files = []
+    stack = [root_dir]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Skip unreadable or vanished directories, as Path.rglob did
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, '*Screenshot*.png'):
+                    match = TIMESTAMP_RE.search(entry.name)
+                    keyed_files.append((match.group(1) if match else "", entry.path))
+    # Sort on the precomputed keys (ties broken by path) so the regex runs once per file
+    keyed_files.sort()
+    return [Path(path) for _, path in keyed_files]
 
 if __name__ == '__main__':
     if ROOT_FOLDER == '':
@@ -184,6 +337,34 @@ if __name__ == '__main__':
         if not image_files:
             print("No screenshot files found to process.")
         else:
-            root = tk.Tk()
-            app = CropValidatorApp(root, image_files)
-            root.mainloop()
+            import tkinter as tk
+            from concurrent.futures import ProcessPoolExecutor
+
+            load_ocr_backend()
+            # Reuse OCR text from earlier runs for screenshots that have not changed
+            ocr_cache = load_ocr_cache(ROOT_FOLDER)
+            ocr_results = {}
+            mtimes = {}
+            for path in image_files:
+                mtimes[path] = os.stat(path).st_mtime_ns
+                cached = ocr_cache.get(str(path))
+                if cached and cached.get('mtime_ns') == mtimes[path]:
+                    ocr_results[path] = cached['text']
+            # OCR is CPU-bound and Tesseract is single-threaded, so run it for every
+            # remaining screenshot across all cores up front; the GUI picks results up as it goes
+            with ProcessPoolExecutor(initializer=load_ocr_backend) as ocr_pool:
+                for path in image_files:
+                    if path not in ocr_results:
+                        ocr_results[path] = ocr_pool.submit(ocr_screenshot, path)
+                root = tk.Tk()
+                app = CropValidatorApp(root, image_files, ocr_results)
+                root.mainloop()
+                ocr_pool.shutdown(wait=False, cancel_futures=True)
+            # Remember every OCR result that completed, for the next run
+            for path, result in ocr_results.items():
+                if not isinstance(result, str):
+                    if not result.done() or result.cancelled() or result.exception() is not None:
+                        continue
+                    result = result.result()
+                ocr_cache[str(path)] = {'mtime_ns': mtimes[path], 'text': result}
+            save_ocr_cache(ROOT_FOLDER, ocr_cache)
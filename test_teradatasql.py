@@ -4,10 +4,11 @@ Test direct connectivity to Teradata Vantage using the teradatasql driver.
 """
 import sys
 import os
-import teradatasql
 from tlptaco.config.loader import load_config
 
 def main():
+    import teradatasql
+
     # Load database config
     cfg = load_config("example_campaign.yaml").database
     host = cfg.host
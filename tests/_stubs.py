@@ -0,0 +1,29 @@
+"""
+Stand-ins for DBRunner and the logger, shared by the campaign-flow tests.
+"""
+
+
+class DummyRunner:
+    """Record executed SQL and answer every query with a copy of one frame."""
+    __slots__ = ('queries', 'result_df')
+
+    def __init__(self, result_df):
+        self.queries = []
+        self.result_df = result_df
+    def run(self, sql):
+        # track executed SQL
+        self.queries.append(sql)
+    def to_df(self, sql):
+        # Hand out a copy so callers can't modify the shared frame
+        return self.result_df.copy()
+    def cleanup(self):
+        pass
+
+
+class DummyLogger:
+    __slots__ = ()
+
+    def info(self, msg): pass
+    def warning(self, msg): pass
+    def debug(self, msg): pass
+    def exception(self, msg): pass
@@ -0,0 +1,73 @@
+import copy
+import pytest
+import yaml
+from pathlib import Path
+
+from tlptaco.config.loader import load_config
+from tlptaco.sql.generator import SQLGenerator
+
+POC_CONFIG_PATH = Path(__file__).resolve().parent.parent / 'example_campaign_poc.yaml'
+
+# libyaml-backed dumper when available, pure-Python otherwise
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@pytest.fixture
+def dump_yaml():
+    """Return a function that serializes an object to YAML text, like yaml.safe_dump."""
+    def _dump(obj):
+        return yaml.dump(obj, Dumper=YamlDumper)
+    return _dump
+
+
+@pytest.fixture(scope='session')
+def poc_config_template():
+    """example_campaign_poc.yaml, loaded and validated once per session."""
+    return load_config(str(POC_CONFIG_PATH))
+
+
+@pytest.fixture
+def poc_config(poc_config_template):
+    """A private copy of the POC AppConfig that the test may modify."""
+    return copy.deepcopy(poc_config_template)
+
+
+# Templates shared by the SQLGenerator tests, written once per session
+SAMPLE_TEMPLATES = {
+    'simple.sql.j2': "SELECT 1;",
+    'test.sql.j2': "SELECT '<tag>' AS col;",
+    'a.sql.j2': "",
+    'b.sql.j2': "",
+    'ignore.txt': "",
+}
+
+
+@pytest.fixture(scope='session')
+def sql_gen(tmp_path_factory):
+    """SQLGenerator over a session-wide directory seeded with SAMPLE_TEMPLATES."""
+    tmpl_dir = tmp_path_factory.mktemp('templates')
+    for name, text in SAMPLE_TEMPLATES.items():
+        (tmpl_dir / name).write_text(text)
+    return SQLGenerator(str(tmpl_dir))
+
+
+class FakeGen(SQLGenerator):
+    """SQLGenerator that renders a dummy SELECT instead of its Jinja templates."""
+    def render(self, template_name, context):
+        return "SELECT * FROM dummy;"
+
+
+@pytest.fixture(scope='module')
+def fake_sql_generator():
+    """
+    Make every engine use FakeGen. Applied once per test module and undone when
+    the module finishes, so it can't leak into modules that use real templates.
+    """
+    import tlptaco.engines.eligibility as elig_mod
+    import tlptaco.engines.waterfall as wf_mod
+    import tlptaco.engines.output as out_mod
+
+    with pytest.MonkeyPatch.context() as mp:
+        for mod in (elig_mod, wf_mod, out_mod):
+            mp.setattr(mod, 'SQLGenerator', FakeGen)
+        yield FakeGen
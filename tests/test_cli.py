@@ -0,0 +1,72 @@
+import os
+import pytest
+
+import tlptaco.cli as cli_mod
+
+
+class DummyRunner:
+    def __init__(self, cfg, logger):
+        self.cleaned_up = False
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+class DummyEngine:
+    ran = []
+    def __init__(self, cfg, runner, logger):
+        self.cfg = cfg
+    def run(self, *args, **kwargs):
+        DummyEngine.ran.append(type(self).__name__)
+
+
+class DummyEligibility(DummyEngine): pass
+class DummyWaterfall(DummyEngine): pass
+class DummyOutput(DummyEngine): pass
+
+
+@pytest.fixture(autouse=True)
+def patch_pipeline(monkeypatch):
+    DummyEngine.ran = []
+    # cli.run imports these at call time, so patch them where they are defined
+    monkeypatch.setattr('tlptaco.db.runner.DBRunner', DummyRunner)
+    monkeypatch.setattr('tlptaco.engines.eligibility.EligibilityEngine', DummyEligibility)
+    monkeypatch.setattr('tlptaco.engines.waterfall.WaterfallEngine', DummyWaterfall)
+    monkeypatch.setattr('tlptaco.engines.output.OutputEngine', DummyOutput)
+    monkeypatch.setattr('tlptaco.utils.logging.configure_logging', lambda cfg, verbose=False: None)
+
+
+def test_cli_import_is_light():
+    import subprocess
+    import sys
+    code = "import sys, tlptaco.cli; print('tlptaco.engines.eligibility' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_parse_args_defaults():
+    args = cli_mod.parse_args(['--config', 'c.yaml'])
+    assert args.config == 'c.yaml'
+    assert args.mode == 'full'
+    assert args.output_dir is None
+    assert not args.verbose and not args.progress
+
+
+def test_run_takes_loaded_config(tmp_path, poc_config):
+    cfg = poc_config
+    cli_mod.run(cfg, output_dir=str(tmp_path), mode='presizing')
+    assert DummyEngine.ran == ['DummyEligibility', 'DummyWaterfall']
+    # Relative paths are resolved under the output directory
+    assert cfg.waterfall.output_directory == os.path.join(str(tmp_path), 'reports/poc/waterfall')
+    for channel_cfg in cfg.output.channels.values():
+        assert channel_cfg.file_location.startswith(str(tmp_path))
+    assert (tmp_path / 'logs').is_dir()
+
+
+def test_progress_skipped_without_terminal(tmp_path, monkeypatch, poc_config):
+    import tlptaco.utils.loading_bar as loading_bar
+    def fail(*args, **kwargs):
+        raise AssertionError('progress bars were created')
+    monkeypatch.setattr(loading_bar, 'ProgressManager', fail)
+    monkeypatch.setattr(cli_mod.sys.stdout, 'isatty', lambda: False, raising=False)
+    cli_mod.run(poc_config, output_dir=str(tmp_path), mode='presizing', progress=True)
+    assert DummyEngine.ran == ['DummyEligibility', 'DummyWaterfall']
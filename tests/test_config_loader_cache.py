@@ -0,0 +1,103 @@
+import os
+import pickle
+import shutil
+import pytest
+from pathlib import Path
+
+import tlptaco.config.loader as loader_mod
+from tlptaco.config.loader import load_config
+from tlptaco.config.schema import AppConfig
+
+POC_CONFIG = Path(__file__).resolve().parent.parent / 'example_campaign_poc.yaml'
+
+
+@pytest.fixture
+def poc_copy(tmp_path):
+    path = tmp_path / 'config.yaml'
+    shutil.copy(POC_CONFIG, path)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'cache'
+    monkeypatch.setattr(loader_mod, 'DISK_CACHE_DIR', str(path))
+    return path
+
+
+def test_disk_cache_disabled_by_default(poc_copy, cache_dir, monkeypatch):
+    monkeypatch.delenv(loader_mod.DISK_CACHE_ENV, raising=False)
+    load_config(str(poc_copy))
+    assert not cache_dir.exists()
+
+
+def test_disk_cache_reused_until_contents_change(poc_copy, cache_dir, monkeypatch):
+    monkeypatch.setenv(loader_mod.DISK_CACHE_ENV, '1')
+    first = load_config(str(poc_copy))
+    assert isinstance(first, AppConfig)
+    assert len(list(cache_dir.glob('config.*.pkl'))) == 1
+
+    # A warm load must come from the snapshot, not from parsing the file
+    def fail_parse(path):
+        raise AssertionError('config was re-parsed')
+    monkeypatch.setattr(loader_mod, '_parse_config', fail_parse)
+    assert load_config(str(poc_copy)) == first
+
+    # Snapshots follow the contents, not the file: a touched file or a copy still hits
+    st = os.stat(poc_copy)
+    os.utime(poc_copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(str(poc_copy)) == first
+    other = poc_copy.with_name('other.yaml')
+    shutil.copy(poc_copy, other)
+    assert load_config(str(other)) == first
+
+    # Editing the contents invalidates the snapshot
+    with open(poc_copy, 'a') as f:
+        f.write('\n# edited\n')
+    with pytest.raises(AssertionError, match='re-parsed'):
+        load_config(str(poc_copy))
+
+
+def test_memory_cache_reused_until_source_changes(poc_copy, monkeypatch):
+    monkeypatch.setenv(loader_mod.MEMORY_CACHE_ENV, '1')
+    monkeypatch.delenv(loader_mod.DISK_CACHE_ENV, raising=False)
+    loader_mod._load_cached.cache_clear()
+    first = load_config(str(poc_copy))
+
+    def fail_parse(path):
+        raise AssertionError('config was re-parsed')
+    monkeypatch.setattr(loader_mod, '_parse_config', fail_parse)
+    second = load_config(str(poc_copy))
+    # Callers get equal but independent copies
+    assert second == first
+    assert second is not first
+    second.logging.file = 'changed.log'
+    assert load_config(str(poc_copy)).logging.file == first.logging.file
+
+    st = os.stat(poc_copy)
+    os.utime(poc_copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(AssertionError, match='re-parsed'):
+        load_config(str(poc_copy))
+
+
+def test_disk_cache_invalidated_by_schema_change(poc_copy, cache_dir, monkeypatch):
+    monkeypatch.setenv(loader_mod.DISK_CACHE_ENV, '1')
+    load_config(str(poc_copy))
+
+    # A different schema (or pydantic) fingerprint must not reuse the snapshot
+    monkeypatch.setattr(loader_mod, '_schema_fingerprint', lambda: b'other-schema')
+    def fail_parse(path):
+        raise AssertionError('config was re-parsed')
+    monkeypatch.setattr(loader_mod, '_parse_config', fail_parse)
+    with pytest.raises(AssertionError, match='re-parsed'):
+        load_config(str(poc_copy))
+
+
+def test_disk_cache_write_failure_does_not_break_load(poc_copy, cache_dir, monkeypatch):
+    monkeypatch.setenv(loader_mod.DISK_CACHE_ENV, '1')
+    def fail_dump(*args, **kwargs):
+        raise pickle.PicklingError('cannot pickle')
+    monkeypatch.setattr(loader_mod.pickle, 'dump', fail_dump)
+    assert isinstance(load_config(str(poc_copy)), AppConfig)
+    # Neither a snapshot nor its temp file is left behind
+    assert list(cache_dir.iterdir()) == []
@@ -6,7 +6,7 @@ from tlptaco.config.loader import load_config
 from tlptaco.config.schema import AppConfig
 
 @pytest.mark.parametrize('format', ['yaml', 'json'])
-def test_complex_config_loading(tmp_path, format):
+def test_complex_config_loading(tmp_path, format, dump_yaml):
     # Create a complex campaign config with multiple channels and segments
     cfg = {
         'logging': {'level': 'DEBUG', 'file': None, 'debug_file': None},
@@ -60,7 +60,7 @@ def test_complex_config_loading(tmp_path, format):
     # Write to file
     path = tmp_path / f'config.{format}'
     if format == 'yaml':
-        path.write_text(yaml.safe_dump(cfg))
+        path.write_text(dump_yaml(cfg))
     else:
         import json
         path.write_text(json.dumps(cfg))
@@ -89,3 +89,20 @@ def test_complex_config_loading(tmp_path, format):
     assert email_cfg.columns == ['t.id', 'chk1', 'chk2', 'segA_c1']
     # unique_on propagated
     assert email_cfg.unique_on == ['t.id']
+
+
+def test_json_config_uses_orjson_when_available(tmp_path, monkeypatch):
+    import json
+    import types
+    import tlptaco.config.loader as loader_mod
+    poc = Path(__file__).resolve().parent.parent / 'example_campaign_poc.yaml'
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(yaml.safe_load(poc.read_text())))
+    calls = []
+    def loads(raw):
+        calls.append(raw)
+        return json.loads(raw)
+    monkeypatch.setattr(loader_mod, 'orjson', types.SimpleNamespace(loads=loads))
+    app_cfg = load_config(str(path))
+    assert isinstance(app_cfg, AppConfig)
+    assert len(calls) == 1 and isinstance(calls[0], bytes)
@@ -11,14 +11,15 @@ from tlptaco.config.schema import (
 )
 
 
+# Condition fixtures are known-good literals, so they are built without validation
 def make_template_conditions():
-    ba = [ConditionCheck(name="chk", sql="1=1")]
-    return TemplateConditions(BA=ba, others={})
+    ba = [ConditionCheck.model_construct(name="chk", sql="1=1")]
+    return TemplateConditions.model_construct(BA=ba, others={})
 
 
 def make_conditions_config():
     base = make_template_conditions()
-    return ConditionsConfig(main=base, channels={"ch": make_template_conditions()})
+    return ConditionsConfig.model_construct(main=base, channels={"ch": make_template_conditions()})
 
 
 def test_output_unique_on_validation_fails():
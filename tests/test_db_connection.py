@@ -28,3 +28,47 @@ def test_no_logmech_passed_when_none():
     conn = DBConnection(host="h2", user="u2", password="p2", logmech=None)
     conn.connect()
     assert 'logmech' not in DummyConnect.last_kwargs
+
+
+def test_executemany_sends_all_rows(monkeypatch):
+    class FakeCursor:
+        def executemany(self, sql, rows):
+            self.sql, self.rows = sql, rows
+    class FakeConn:
+        def cursor(self):
+            return FakeCursor()
+        def commit(self):
+            pass
+    monkeypatch.setattr(teradatasql, 'connect', lambda **kwargs: FakeConn())
+    conn = DBConnection(host="h", user="u", password="p")
+    cur = conn.executemany("INSERT INTO t (a, b) VALUES (?, ?)", [(1, 'x'), (2, 'y')])
+    assert cur.sql == "INSERT INTO t (a, b) VALUES (?, ?)"
+    assert cur.rows == [(1, 'x'), (2, 'y')]
+
+
+def test_transaction_defers_commit_until_end(monkeypatch):
+    from tlptaco.db.runner import DBRunner
+    commits = []
+    class FakeCursor:
+        def execute(self, sql):
+            pass
+    class FakeConn:
+        autocommit = True
+        def cursor(self):
+            return FakeCursor()
+        def commit(self):
+            commits.append(self.autocommit)
+    class NullLogger:
+        def info(self, msg): pass
+        def debug(self, msg): pass
+    class Cfg:
+        host, user, password, logmech = "h", "u", "p", None
+    monkeypatch.setattr(teradatasql, 'connect', lambda **kwargs: FakeConn())
+    runner = DBRunner(Cfg, NullLogger())
+    with runner.transaction():
+        runner.run("INSERT INTO t VALUES (1);")
+        runner.run("INSERT INTO t VALUES (2);")
+        assert commits == []
+    # A single commit, issued while autocommit was off
+    assert commits == [False]
+    assert runner.conn.conn.autocommit is True
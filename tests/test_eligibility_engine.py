@@ -32,10 +32,10 @@ def patch_sqlgenerator(monkeypatch):
     yield
 
 def make_config():
-    # Build a minimal EligibilityConfig
-    main_checks = [ConditionCheck(name="chk", sql="1=1")]
-    tmpl_main = TemplateConditions(BA=main_checks, others={})
-    conds = ConditionsConfig(main=tmpl_main, channels={})
+    # Build a minimal EligibilityConfig; the condition literals skip validation
+    main_checks = [ConditionCheck.model_construct(name="chk", sql="1=1")]
+    tmpl_main = TemplateConditions.model_construct(BA=main_checks, others={})
+    conds = ConditionsConfig.model_construct(main=tmpl_main, channels={})
     tables = [
         TableConfig(
             name="tbl", alias="tbl", sql=None,
@@ -1,5 +1,4 @@
 import os
-import yaml
 import pytest
 import pandas as pd
 
@@ -10,44 +9,21 @@ from tlptaco.engines.eligibility import EligibilityEngine
 from tlptaco.engines.waterfall import WaterfallEngine
 from tlptaco.engines.output import OutputEngine
 
+from _stubs import DummyRunner, DummyLogger
 
-class DummyRunner:
-    def __init__(self):
-        self.queries = []
-    def run(self, sql):
-        # track executed SQL
-        self.queries.append(sql)
-    def to_df(self, sql):
-        # Return a simple DataFrame for waterfall and output
-        return pd.DataFrame([
-            {'check_name': 'chkA', 'stat_name': 'unique_drops', 'value': 1},
-            {'check_name': 'chkB', 'stat_name': 'remaining', 'value': 2},
-        ])
-    def cleanup(self):
-        pass
 
-class DummyLogger:
-    def info(self, msg): pass
-    def warning(self, msg): pass
-    def debug(self, msg): pass
-    def exception(self, msg): pass
+# Simple result for waterfall and output queries, built once for all queries
+DUMMY_RESULT_DF = pd.DataFrame({
+    'check_name': ['chkA', 'chkB'],
+    'stat_name': ['unique_drops', 'remaining'],
+    'cntr': pd.Series([1, 2], dtype='int64'),
+    'section': ['segX', 'segY'],
+})
 
-@pytest.fixture(autouse=True)
-def patch_sqlgenerator(monkeypatch):
-    # Fake SQLGenerator to bypass Jinja templates
-    from tlptaco.sql.generator import SQLGenerator as RealGen
-    class FakeGen(RealGen):
-        def render(self, template_name, context):
-            return "SELECT * FROM dummy;"
-    import tlptaco.engines.eligibility as elig_mod
-    import tlptaco.engines.waterfall as wf_mod
-    import tlptaco.engines.output as out_mod
-    monkeypatch.setattr(elig_mod, 'SQLGenerator', FakeGen)
-    monkeypatch.setattr(wf_mod, 'SQLGenerator', FakeGen)
-    monkeypatch.setattr(out_mod, 'SQLGenerator', FakeGen)
-    yield
+# Engines render a dummy SELECT instead of their templates (see conftest.py)
+pytestmark = pytest.mark.usefixtures('fake_sql_generator')
 
-def test_full_campaign_from_yaml(tmp_path, monkeypatch):
+def test_full_campaign_from_yaml(tmp_path, monkeypatch, dump_yaml):
     # Build a complex config with multiple channels and templates
     cfg = {
         'logging': {'level': 'INFO', 'file': None, 'debug_file': None},
@@ -118,13 +94,13 @@ def test_full_campaign_from_yaml(tmp_path, monkeypatch):
     }
     # Write YAML config
     cfg_path = tmp_path / 'config.yaml'
-    cfg_path.write_text(yaml.safe_dump(cfg))
+    cfg_path.write_text(dump_yaml(cfg))
     # Load into AppConfig
     app_cfg = load_config(str(cfg_path))
     assert isinstance(app_cfg, AppConfig)
 
     # Prepare runner and logger
-    runner = DummyRunner()
+    runner = DummyRunner(DUMMY_RESULT_DF)
     logger = DummyLogger()
 
     # Run eligibility
@@ -148,10 +124,10 @@ def test_full_campaign_from_yaml(tmp_path, monkeypatch):
 
     # Run output stage
     out_records = []
-    from tlptaco.iostream import writer as io_writer
     def fake_write(df, path, fmt, **kwargs):
         out_records.append({'path': path, 'fmt': fmt, 'df': df.copy()})
-    monkeypatch.setattr(io_writer, 'write_dataframe', fake_write)
+    # OutputEngine imports write_dataframe by name, so patch it where it is used
+    monkeypatch.setattr('tlptaco.engines.output.write_dataframe', fake_write)
     out_engine = OutputEngine(app_cfg.output, runner, logger)
     out_engine.run(elig_engine)
     # Validate outputs for each channel
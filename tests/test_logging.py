@@ -0,0 +1,19 @@
+import logging
+
+from tlptaco.config.schema import LoggingConfig
+from tlptaco.utils.logging import configure_logging
+
+
+def test_reconfiguring_replaces_handlers(tmp_path):
+    cfg = LoggingConfig(level='INFO', file=str(tmp_path / 'run.log'), debug_file=None)
+    root = logging.getLogger()
+    before = list(root.handlers)
+    configure_logging(cfg)
+    first = [h for h in root.handlers if h not in before]
+    configure_logging(cfg)
+    second = [h for h in root.handlers if h not in before]
+    assert len(first) == len(second) == 2
+    assert not set(first) & set(second)
+    for handler in second:
+        root.removeHandler(handler)
+        handler.close()
@@ -0,0 +1,58 @@
+import os
+import pandas as pd
+import pytest
+
+from tlptaco.engines.output import OutputEngine
+from tlptaco.config.schema import (
+    EligibilityConfig, ConditionsConfig, TemplateConditions, ConditionCheck,
+    OutputConfig, OutputChannelConfig, OutputOptions
+)
+
+from _stubs import DummyRunner, DummyLogger
+
+# Engines render a dummy SELECT instead of their templates (see conftest.py)
+pytestmark = pytest.mark.usefixtures('fake_sql_generator')
+
+
+class DummyEligibility:
+    def __init__(self, cfg):
+        self.cfg = cfg
+
+
+def make_engines(tmp_path, fmt):
+    checks = TemplateConditions.model_construct(
+        BA=[ConditionCheck.model_construct(name='chk1', sql='1=1')], others={})
+    elig_cfg = EligibilityConfig.model_construct(
+        eligibility_table='elig_tbl',
+        conditions=ConditionsConfig.model_construct(main=checks, channels={'email': checks}),
+        tables=[],
+        unique_identifiers=['t.id']
+    )
+    out_ch = OutputChannelConfig.model_construct(
+        columns=['t.id'],
+        file_location=str(tmp_path),
+        file_base_name='email_out',
+        output_options=OutputOptions.model_construct(format=fmt, additional_arguments={},
+                                                     custom_function=None),
+        unique_on=[]
+    )
+    out_cfg = OutputConfig.model_construct(channels={'email': out_ch})
+    runner = DummyRunner(pd.DataFrame({'id': [1, 2]}))
+    return OutputEngine(out_cfg, runner, DummyLogger()), DummyEligibility(elig_cfg)
+
+
+@pytest.mark.parametrize('fmt, file_name', [
+    ('csv', 'email_out.csv'),
+    ('parquet', 'email_out.parquet'),
+    ('xlsx', 'email_out.xlsx'),
+    ('excel', 'email_out.xlsx'),
+])
+def test_output_path_uses_format_extension(tmp_path, monkeypatch, fmt, file_name):
+    engine, elig_engine = make_engines(tmp_path, fmt)
+    written = []
+    def fake_write(df, path, fmt, **kwargs):
+        written.append((path, fmt))
+    monkeypatch.setattr('tlptaco.engines.output.write_dataframe', fake_write)
+    engine.run(elig_engine)
+    # The writer still gets the configured format name
+    assert written == [(os.path.join(str(tmp_path), file_name), fmt)]
@@ -2,25 +2,23 @@ import os
 import tlptaco.sql.generator as mod
 from tlptaco.sql.generator import SQLGenerator
 
-def test_basic_rendering(tmp_path):
-    # Create a simple SQL template and ensure render returns raw content
-    tmpl_dir = tmp_path
-    tmpl_file = tmpl_dir / "simple.sql.j2"
-    tmpl_file.write_text("SELECT 1;")
-    gen = SQLGenerator(str(tmpl_dir))
-    rendered = gen.render('simple.sql.j2', {})
+def test_basic_rendering(sql_gen):
     # Rendered SQL should match the template exactly
+    rendered = sql_gen.render('simple.sql.j2', {})
     assert rendered.strip() == "SELECT 1;"
 
-def test_list_templates_filtering(tmp_path):
-    # Create mixed files in templates
-    names = ["a.sql.j2", "b.sql.j2", "ignore.txt"]
-    for name in names:
-        (tmp_path / name).write_text("")
-    gen = SQLGenerator(str(tmp_path))
-    all_tpls = gen.list_templates()
+def test_list_templates_filtering(sql_gen):
     # Only .sql.j2 files are listed by default
-    assert set(all_tpls) == {"a.sql.j2", "b.sql.j2"}
+    all_tpls = sql_gen.list_templates()
+    assert {"a.sql.j2", "b.sql.j2"} <= set(all_tpls)
+    assert "ignore.txt" not in all_tpls
     # filter_func works
-    filtered = gen.list_templates(filter_func=lambda n: n.startswith('b'))
+    filtered = sql_gen.list_templates(filter_func=lambda n: n.startswith('b'))
     assert filtered == ['b.sql.j2']
+
+def test_generators_share_compiled_templates(tmp_path):
+    (tmp_path / "simple.sql.j2").write_text("SELECT 1;")
+    first = SQLGenerator(str(tmp_path))
+    second = SQLGenerator(str(tmp_path))
+    assert first.env is second.env
+    assert first.env.get_template('simple.sql.j2') is second.env.get_template('simple.sql.j2')
@@ -2,18 +2,14 @@
 Command-line interface for tlptaco version 2.
 """
 import argparse
+import os
 import sys
 
-from tlptaco.config.loader import load_config
-from tlptaco.db.runner import DBRunner
-from tlptaco.engines.eligibility import EligibilityEngine
-from tlptaco.engines.waterfall import WaterfallEngine
-from tlptaco.engines.output import OutputEngine
-from tlptaco.utils.logging import configure_logging
+# Config, database and engine modules are imported inside run()/main(), so that
+# --help and usage errors only cost argparse.
 
-def main():
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="tlptaco v2: Eligibility → Waterfall → Output pipeline")
-    import os
     parser.add_argument("--config", "-c", required=True, help="Path to configuration YAML/JSON file")
     parser.add_argument("--output-dir", "-o", default=None,
                         help="Directory to write outputs and logs (defaults to current working directory)")
@@ -21,13 +17,24 @@ def main():
                         help="Run mode: full (includes output) or presizing (eligibility+waterfall only)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose (DEBUG) console output")
     parser.add_argument("--progress", "-p", action="store_true", help="Show progress bars for pipeline stages (requires rich)")
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def run(config, output_dir=None, mode="full", verbose=False, progress=False):
+    """
+    Run the pipeline for an already-loaded AppConfig. Relative log, waterfall and
+    output paths in config are resolved against output_dir (default: the current
+    working directory), updating config in place. progress is ignored when stdout
+    is not a terminal or TLPTACO_NO_PROGRESS is set.
+    """
+    from tlptaco.db.runner import DBRunner
+    from tlptaco.engines.eligibility import EligibilityEngine
+    from tlptaco.engines.waterfall import WaterfallEngine
+    from tlptaco.engines.output import OutputEngine
+    from tlptaco.utils.logging import configure_logging
 
     # Determine working directory for outputs/logs
-    workdir = os.path.abspath(args.output_dir) if args.output_dir else os.getcwd()
+    workdir = os.path.abspath(output_dir) if output_dir else os.getcwd()
     os.makedirs(os.path.join(workdir, 'logs'), exist_ok=True)
-    # Load configuration
-    config = load_config(args.config)
     # Override logging paths to use workdir if not explicitly set
     if not config.logging.file:
         config.logging.file = os.path.join(workdir, 'logs', 'tlptaco.log')
@@ -45,39 +52,52 @@ def main():
         loc = channel_cfg.file_location
         if loc and not os.path.isabs(loc):
             channel_cfg.file_location = os.path.join(workdir, loc)
-    logger = configure_logging(config.logging, verbose=args.verbose)
+    logger = configure_logging(config.logging, verbose=verbose)
     runner = DBRunner(config.database, logger)
 
     # Instantiate engines
     eligibility_engine = EligibilityEngine(config.eligibility, runner, logger)
     waterfall_engine = WaterfallEngine(config.waterfall, runner, logger)
-    if args.mode == "full":
+    if mode == "full":
         output_engine = OutputEngine(config.output, runner, logger)
 
-    if args.progress:
+    # Progress bars only help on an interactive terminal; skip Rich entirely otherwise
+    if progress and (not sys.stdout.isatty() or os.environ.get("TLPTACO_NO_PROGRESS")):
+        progress = False
+
+    if progress:
         # Lazy import of ProgressManager to avoid requiring rich if unused
         from tlptaco.utils.loading_bar import ProgressManager
         # Determine steps for each stage
         elig_steps = eligibility_engine.num_steps()
         wf_steps = waterfall_engine.num_steps(eligibility_engine)
         layers = [("Eligibility", elig_steps), ("Waterfall", wf_steps)]
-        if args.mode == "full":
+        if mode == "full":
             out_steps = output_engine.num_steps(eligibility_engine)
             layers.append(("Output", out_steps))
         # Run with progress bars
         with ProgressManager(layers, units="steps") as pm:
             eligibility_engine.run(progress=pm)
             waterfall_engine.run(progress=pm)
-            if args.mode == "full":
+            if mode == "full":
                 output_engine.run(progress=pm)
     else:
         # Run without progress bars
         eligibility_engine.run()
         waterfall_engine.run(eligibility_engine)
-        if args.mode == "full":
+        if mode == "full":
             output_engine.run(eligibility_engine)
 
     runner.cleanup()
 
+def main(argv=None):
+    args = parse_args(argv)
+    from tlptaco.config.loader import load_config
+
+    # Load configuration
+    config = load_config(args.config)
+    run(config, output_dir=args.output_dir, mode=args.mode,
+        verbose=args.verbose, progress=args.progress)
+
 if __name__ == "__main__":
     main()
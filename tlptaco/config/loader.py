@@ -3,25 +3,157 @@ Load and parse tlptaco configuration files into Pydantic models.
 """
 try:
     import yaml
+    # Prefer the libyaml-backed C loader; fall back to the pure-Python one
+    YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
-    yaml = None
+    yaml = YamlLoader = None
+try:
+    # Optional faster JSON parser; the stdlib json module is used when it is missing
+    import orjson
+except ImportError:
+    orjson = None
+import copy
+import functools
+import hashlib
 import json
+import os
+import pickle
+
+import pydantic
 
+import tlptaco.config.schema as schema_module
 from tlptaco.config.schema import AppConfig
 
-def load_config(path: str) -> AppConfig:
+# Opt-in in-process cache of validated configs, keyed on the file's path, mtime and size.
+# Set TLPTACO_CONFIG_CACHE=1 to enable it.
+MEMORY_CACHE_ENV = 'TLPTACO_CONFIG_CACHE'
+
+# Opt-in on-disk snapshots of validated AppConfigs, keyed by a hash of the config
+# file's contents and of the schema that validated it, stored under DISK_CACHE_DIR.
+# Set TLPTACO_CONFIG_DISK_CACHE=1 to enable them.
+DISK_CACHE_ENV = 'TLPTACO_CONFIG_DISK_CACHE'
+DISK_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'tlptaco',
+)
+
+
+def _parse_config(path: str) -> AppConfig:
     """
-    Load a YAML or JSON config file and parse into AppConfig.
+    Read and validate a YAML or JSON config file without any caching.
     """
     if path.lower().endswith(('.yml', '.yaml')):
         if yaml is None:
             raise ImportError("PyYAML is required to load YAML configs; please install pyyaml")
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
     elif path.lower().endswith('.json'):
-        with open(path, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
     else:
         raise ValueError('Unsupported config format, must be .yaml/.yml or .json')
 
-    return AppConfig.parse_obj(data)
\ No newline at end of file
+    return AppConfig.model_validate(data)
+
+
+def _source_key(path: str) -> tuple:
+    """Identify the current version of a config file by its mtime and size."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint() -> bytes:
+    """
+    Identify the schema code and pydantic version, so snapshots taken before an
+    upgrade are never loaded without the current validation.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pydantic.VERSION.encode())
+    with open(schema_module.__file__, 'rb') as f:
+        h.update(f.read())
+    return h.digest()
+
+
+def _content_key(path: str) -> str:
+    """Hash the schema fingerprint and a config file's extension and contents into a snapshot key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_schema_fingerprint())
+    h.update(os.path.splitext(path)[1].lower().encode())
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def _read_snapshot(snapshot_path: str, key: str):
+    """
+    Return the AppConfig pickled in snapshot_path if it was taken from the same
+    config contents, else None.
+    """
+    try:
+        with open(snapshot_path, 'rb') as f:
+            # The key is stored as its own record so a mismatched snapshot is
+            # rejected without unpickling the config.
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_snapshot(snapshot_path: str, key: str, cfg: AppConfig):
+    """Atomically write a snapshot; failures only cost the cache, never the load."""
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(cfg, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_uncached(path: str) -> AppConfig:
+    """Load a config, going through the on-disk snapshot when it is enabled."""
+    if os.environ.get(DISK_CACHE_ENV) != '1':
+        return _parse_config(path)
+
+    key = _content_key(path)
+    snapshot_path = os.path.join(DISK_CACHE_DIR, f'config.{key}.pkl')
+    cfg = _read_snapshot(snapshot_path, key)
+    if cfg is None:
+        cfg = _parse_config(path)
+        _write_snapshot(snapshot_path, key, cfg)
+    return cfg
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(abspath: str, mtime_ns: int, size: int) -> AppConfig:
+    # mtime_ns and size are only part of the cache key
+    return _load_uncached(abspath)
+
+
+def load_config(path: str) -> AppConfig:
+    """
+    Load a YAML or JSON config file and parse into AppConfig.
+
+    When TLPTACO_CONFIG_CACHE=1, configs are cached in-process and reused until the
+    source file's mtime or size changes; each call gets its own copy, since callers
+    may modify the config they are given.
+
+    When TLPTACO_CONFIG_DISK_CACHE=1, the validated config is pickled under
+    DISK_CACHE_DIR (~/.cache/tlptaco by default) and reused by any later load of a
+    file with the same contents.
+    """
+    if os.environ.get(MEMORY_CACHE_ENV) == '1':
+        abspath = os.path.abspath(path)
+        return copy.deepcopy(_load_cached(abspath, *_source_key(abspath)))
+    return _load_uncached(path)
@@ -5,6 +5,10 @@ from pydantic import BaseModel, model_validator, field_validator
 from typing import List, Dict, Optional, Any, Union
 import re
 
+# Name patterns, compiled once for every config validated
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_TABLE_NAME_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$')
+
 # --- Base Models ---
 
 class ConditionCheck(BaseModel):
@@ -23,7 +27,7 @@ class ConditionsConfig(BaseModel):
 class TableConfig(BaseModel):
     name: str
     alias: str
-    sql: Optional[str] # Made optional as it might not always be used
+    sql: Optional[str] = None # Made optional as it might not always be used
     join_type: Optional[str]
     join_conditions: Optional[str]
     where_conditions: Optional[str]
@@ -32,7 +36,7 @@ class TableConfig(BaseModel):
     # Ensure alias is a valid identifier (starts with letter/_ and contains only alphanumeric/_)
     @field_validator('alias', mode='before')
     def validate_alias(cls, v):  # type: ignore[name-defined]
-        if not isinstance(v, str) or not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', v):
+        if not isinstance(v, str) or not _IDENTIFIER_RE.match(v):
             raise ValueError(
                 f"Invalid alias '{v}'. Must start with a letter or underscore and contain only alphanumeric characters or underscores."
             )
@@ -66,9 +70,7 @@ class EligibilityConfig(BaseModel):
     # Validate eligibility_table naming: identifier or schema.table
     @field_validator('eligibility_table', mode='before')
     def validate_eligibility_table(cls, v):  # type: ignore[name-defined]
-        if not isinstance(v, str) or not re.match(
-            r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$', v
-        ):
+        if not isinstance(v, str) or not _TABLE_NAME_RE.match(v):
             raise ValueError(
                 f"Invalid eligibility_table '{v}'. Must be a valid identifier or schema.table."
             )
@@ -88,8 +90,8 @@ class OutputChannelConfig(BaseModel):
     @model_validator(mode='after')
     def check_unique_on_are_in_columns(self) -> 'OutputChannelConfig':
         if self.unique_on:
-            if not set(self.unique_on).issubset(set(self.columns)):
-                missing = set(self.unique_on) - set(self.columns)
+            missing = set(self.unique_on).difference(self.columns)
+            if missing:
                 raise ValueError(
                     f"'unique_on' columns {missing} are not present in the selected 'columns'."
                 )
@@ -1,7 +1,6 @@
 """
 Wrap Teradata (and other) connections for SQL execution and data transfer.
 """
-import teradatasql
 import pandas as pd
 from typing import Any
 
@@ -13,9 +12,13 @@ class DBConnection:
         self.password = password
         self.logmech = logmech
         self.conn = None
+        self.in_transaction = False
 
     def connect(self):
-        # Establish a direct teradatasql (DB-API) connection
+        # The driver is imported on first connect so code paths that never touch
+        # the database don't pay for loading it
+        import teradatasql
+
         # Build connection arguments
         conn_kwargs = {
             'host': self.host,
@@ -35,18 +38,54 @@ class DBConnection:
             except Exception:
                 pass
             self.conn = None
+            self.in_transaction = False
+
+    def begin(self):
+        # Switch off autocommit so subsequent statements share one transaction
+        if self.conn is None:
+            self.connect()
+        self.conn.autocommit = False
+        self.in_transaction = True
+
+    def commit(self):
+        try:
+            self.conn.commit()
+        finally:
+            self.conn.autocommit = True
+            self.in_transaction = False
+
+    def rollback(self):
+        try:
+            self.conn.rollback()
+        finally:
+            self.conn.autocommit = True
+            self.in_transaction = False
 
     def execute(self, sql: str) -> Any:
         if self.conn is None:
             self.connect()
         cur = self.conn.cursor()
         cur.execute(sql)
-        # Commit DDL/DML to the database
-        try:
-            self.conn.commit()
-        except Exception:
-            # Some drivers auto-commit or may not support explicit commit
-            pass
+        # Commit DDL/DML to the database, unless an explicit transaction is open
+        if not self.in_transaction:
+            try:
+                self.conn.commit()
+            except Exception:
+                # Some drivers auto-commit or may not support explicit commit
+                pass
+        return cur
+
+    def executemany(self, sql: str, rows) -> Any:
+        if self.conn is None:
+            self.connect()
+        cur = self.conn.cursor()
+        # teradatasql sends all parameter rows to the database in a single batch request
+        cur.executemany(sql, rows)
+        if not self.in_transaction:
+            try:
+                self.conn.commit()
+            except Exception:
+                pass
         return cur
 
     def to_df(self, sql: str):
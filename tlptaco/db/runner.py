@@ -2,6 +2,7 @@
 Simple runner to orchestrate multiple SQL executions.
 """
 import time
+from contextlib import contextmanager
 from typing import List
 from tlptaco.db.connection import DBConnection
 
@@ -30,6 +31,39 @@ class DBRunner:
             results.append(self.run(s))
         return results
 
+    def run_batch(self, sql: str, rows):
+        """
+        Execute a parameterized SQL statement once per row of parameters as a single
+        batch request, log the SQL text, row count and timing, and return the cursor.
+        """
+        start = time.time()
+        rows = list(rows)
+        self.logger.info(f"Executing batched SQL statement for {len(rows)} rows")
+        self.logger.debug(sql)
+        cur = self.conn.executemany(sql, rows)
+        duration = time.time() - start
+        self.logger.info(f"Batched SQL execution finished in {duration:.2f}s")
+        return cur
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed statements in a single transaction, committed once on exit
+        and rolled back if any statement raises.
+        """
+        self.logger.info("Beginning transaction")
+        self.conn.begin()
+        try:
+            yield self
+        except Exception:
+            self.logger.info("Rolling back transaction")
+            self.conn.rollback()
+            raise
+        start = time.time()
+        self.conn.commit()
+        duration = time.time() - start
+        self.logger.info(f"Transaction committed in {duration:.2f}s")
+
     def to_df(self, sql: str):
         """
         Execute a SQL query and return a pandas DataFrame, logging SQL text, timing, and shape.
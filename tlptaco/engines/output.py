@@ -9,6 +9,9 @@ from tlptaco.sql.generator import SQLGenerator
 import os
 import importlib
 
+# File extensions for output formats whose name is not the extension itself
+_FORMAT_EXTENSIONS = {'excel': 'xlsx'}
+
 
 class OutputEngine:
     def __init__(self, cfg: OutputConfig, runner: DBRunner, logger=None):
@@ -93,7 +96,9 @@ class OutputEngine:
                        'unique_on': out_cfg.unique_on, 'cases': cases}
             sql = gen.render('output.sql.j2', context)
 
-            path = os.path.join(out_cfg.file_location, f"{out_cfg.file_base_name}.{out_cfg.output_options.format}")
+            fmt = out_cfg.output_options.format
+            ext = _FORMAT_EXTENSIONS.get(fmt, fmt)
+            path = os.path.join(out_cfg.file_location, f"{out_cfg.file_base_name}.{ext}")
 
             self._output_jobs.append({
                 'channel_name': channel_name,
@@ -52,13 +52,16 @@ class WaterfallEngine:
             conditions = [f"c.{check.name} = 1" for check in check_list]
             return f"({op.join(conditions)})"
 
+        # The main BA checks and the filter built from them are the same for every group
+        main_ba_checks = [chk.name for chk in elig_cfg.conditions.main.BA]
+        base_filter = create_sql_condition(elig_cfg.conditions.main.BA)
+
         # 2. For each group, prepare the SQL and metadata for each report section
         for grp in groups:
             name, uniq_ids = grp['name'], grp['cols']
             sql_jobs = []
 
             # --- SECTION 1: MAIN/BASE WATERFALL ---
-            main_ba_checks = [chk.name for chk in elig_cfg.conditions.main.BA]
             ctx_main = {'eligibility_table': elig_cfg.eligibility_table, 'unique_identifiers': uniq_ids,
                         'check_columns': main_ba_checks, 'pre_filter': None}
             sql_main = gen.render('waterfall_full.sql.j2', ctx_main)
@@ -66,8 +69,6 @@ class WaterfallEngine:
 
             # --- SECTION 2: PER-CHANNEL WATERFALLS ---
             for channel_name, channel_cfg in elig_cfg.conditions.channels.items():
-                base_filter = create_sql_condition(elig_cfg.conditions.main.BA)
-
                 channel_ba_checks_list = channel_cfg.BA
                 channel_ba_check_names = [chk.name for chk in channel_ba_checks_list]
                 ctx_chan_ba = {'eligibility_table': elig_cfg.eligibility_table, 'unique_identifiers': uniq_ids,
@@ -148,9 +149,9 @@ class WaterfallEngine:
                     elif job['type'] == 'segments':
                         summary_rows = df_raw[df_raw['stat_name'] == 'Records Claimed'].copy()
                         detail_rows = df_raw[df_raw['stat_name'] != 'Records Claimed'].copy()
-                        for section_name in detail_rows['section'].unique():
-                            section_df = self._pivot_waterfall_df(detail_rows[detail_rows['section'] == section_name],
-                                                                  section_name)
+                        # One grouping pass instead of re-filtering the frame per section
+                        for section_name, section_rows in detail_rows.groupby('section', sort=False):
+                            section_df = self._pivot_waterfall_df(section_rows, section_name)
                             all_report_sections.append(section_df)
                         all_report_sections.append(summary_rows[['section', 'stat_name', 'cntr']])
 
@@ -1,21 +1,35 @@
 """
 Render SQL from Jinja2 templates with provided context.
 """
+import functools
 import os
 try:
     from jinja2 import Environment, FileSystemLoader, select_autoescape
 except ImportError:
     Environment = FileSystemLoader = select_autoescape = None
 
+@functools.lru_cache(maxsize=None)
+def _environment(templates_dir: str):
+    """
+    Return the Jinja environment for a templates directory, shared by every
+    SQLGenerator so each template is compiled once per process.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["sql", "jinja"]),
+        cache_size=-1,
+        auto_reload=False,
+    )
+
+
 class SQLGenerator:
     def __init__(self, templates_dir: str):
         if Environment is None:
             raise ImportError("jinja2 is required to render SQL templates; please install jinja2")
         # Prepare Jinja environment
-        self.env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape(["sql", "jinja"])
-        )
+        self.env = _environment(os.path.abspath(templates_dir))
+        # '.sql.j2' template names, listed on first use
+        self._template_names = None
         # No version or commit tracking in SQL generation (removed per user request)
 
     def render(self, template_name: str, context: dict) -> str:
@@ -30,9 +44,12 @@ class SQLGenerator:
         List available SQL templates in the environment.
         By default, only files ending with '.sql.j2' are returned.
         Optionally, apply a filter_func(name) to further filter template names.
+        The directory is only scanned on the first call.
         """
-        templates = [name for name in self.env.list_templates()
-                     if name.endswith('.sql.j2')]
+        if self._template_names is None:
+            self._template_names = [name for name in self.env.list_templates()
+                                    if name.endswith('.sql.j2')]
+        templates = list(self._template_names)
         if filter_func:
             templates = [name for name in templates if filter_func(name)]
         return templates
@@ -27,32 +27,47 @@ class EmojiFormatter(logging.Formatter):
         record.emoji = LEVEL_EMOJI.get(record.levelname, "")
         return super().format(record)
 
+if RichHandler is not None and Text is not None:
+    class EmojiRichHandler(RichHandler):  # type: ignore
+        """
+        RichHandler that prefixes level names with an emoji.
+        """
+        def get_level_text(self, record):  # noqa: A003
+            level = record.levelname
+            style = f"logging.level.{level.lower()}"
+            emoji = LEVEL_EMOJI.get(level, "")
+            # pad level name to width 8
+            padded = level.ljust(8)
+            return Text.assemble((emoji + ' ' + padded, style))
+else:
+    EmojiRichHandler = None
+
+# Handlers attached by the last configure_logging call, replaced on the next one
+_installed_handlers = []
+
 def configure_logging(cfg, verbose=False):
     """
     Configure root logger:
       - console handler at DEBUG if verbose, else cfg.level
       - file handler at cfg.level if cfg.file
       - debug file handler at DEBUG if cfg.debug_file
+    Handlers from a previous call are removed first, so configuring again does
+    not emit every record twice.
     Returns the root logger.
     """
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
+    while _installed_handlers:
+        handler = _installed_handlers.pop()
+        root.removeHandler(handler)
+        handler.close()
     # Prepare EmojiFormatter for file handlers or fallback console
     fmt_str = "%(emoji)s %(asctime)s %(name)s %(levelname)s: %(message)s"
     fmt = EmojiFormatter(fmt_str, datefmt="[%X]")
     # Determine console log level
     console_level = logging.DEBUG if verbose else getattr(logging, cfg.level.upper(), logging.INFO)
     # Console handler: use EmojiRichHandler (with emojis) if Rich is available, else fallback
-    if RichHandler is not None and Text is not None:
-        # Subclass RichHandler to prefix level names with emoji
-        class EmojiRichHandler(RichHandler):  # type: ignore
-            def get_level_text(self, record):  # noqa: A003
-                level = record.levelname
-                style = f"logging.level.{level.lower()}"
-                emoji = LEVEL_EMOJI.get(level, "")
-                # pad level name to width 8
-                padded = level.ljust(8)
-                return Text.assemble((emoji + ' ' + padded, style))
+    if EmojiRichHandler is not None:
         rich_handler = EmojiRichHandler(
             level=console_level,
             markup=True,
@@ -61,11 +76,13 @@ def configure_logging(cfg, verbose=False):
             show_path=False,
         )
         root.addHandler(rich_handler)
+        _installed_handlers.append(rich_handler)
     else:
         ch = logging.StreamHandler()
         ch.setLevel(console_level)
         ch.setFormatter(fmt)
         root.addHandler(ch)
+        _installed_handlers.append(ch)
     # File handler
     if getattr(cfg, 'file', None):
         fh = logging.FileHandler(cfg.file)
@@ -73,12 +90,14 @@ def configure_logging(cfg, verbose=False):
         fh.setLevel(file_level)
         fh.setFormatter(fmt)
         root.addHandler(fh)
+        _installed_handlers.append(fh)
     # Debug file handler
     if getattr(cfg, 'debug_file', None):
         dfh = logging.FileHandler(cfg.debug_file)
         dfh.setLevel(logging.DEBUG)
         dfh.setFormatter(fmt)
         root.addHandler(dfh)
+        _installed_handlers.append(dfh)
     return root
 
 def get_logger(name: str):